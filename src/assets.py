@@ -2,26 +2,25 @@ from __future__ import annotations
 
 import os
 import random
-from typing import Dict, List, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, List, Sequence, Tuple
 
 import pygame
-from PIL import Image
 
 
 
 
 
 def discover_types(assets_root: str) -> List[str]:
-    entries = []
-    for name in os.listdir(assets_root):
-        full = os.path.join(assets_root, name)
-        if os.path.isdir(full):
-            entries.append(name)
-    return sorted(entries)
+    with os.scandir(assets_root) as it:
+        return sorted(e.name for e in it if e.is_dir())
 
 
 def validate_expected_type_dirs(assets_root: str, expected_types: set[str]) -> None:
-    actual_dirs = {name for name in os.listdir(assets_root) if os.path.isdir(os.path.join(assets_root, name))}
+    with os.scandir(assets_root) as it:
+        actual_dirs = {e.name for e in it if e.is_dir()}
     missing = expected_types - actual_dirs
     extra = actual_dirs - expected_types
     if missing:
@@ -30,50 +29,98 @@ def validate_expected_type_dirs(assets_root: str, expected_types: set[str]) -> N
         raise ValueError(f"Unexpected extra type directories in assets_root: {sorted(extra)}")
 
 
-def list_images_for_type(type_dir: str, supported_formats: List[str]) -> List[str]:
+def list_images_for_type(type_dir: str, supported_formats: Sequence[str]) -> List[str]:
     allowed = {ext.lower() for ext in supported_formats}
     files = []
-    for fname in os.listdir(type_dir):
-        full = os.path.join(type_dir, fname)
-        if os.path.isfile(full):
-            ext = os.path.splitext(fname)[1].lower().lstrip(".")
-            if ext in allowed:
-                files.append(full)
+    with os.scandir(type_dir) as it:
+        for e in it:
+            if e.is_file():
+                ext = os.path.splitext(e.name)[1].lower().lstrip(".")
+                if ext in allowed:
+                    files.append(e.path)
     return sorted(files)
 
 
+def scale_to_tile(surface: pygame.Surface, tile_size: Tuple[int, int]) -> pygame.Surface:
+    # Convert to the display pixel format (also guarantees a depth smoothscale accepts),
+    # then stretch to fill exactly tile rect (no bars, no crops)
+    return pygame.transform.smoothscale(surface.convert(), tile_size)
+
+
 def load_and_scale_image(path: str, tile_size: Tuple[int, int]) -> pygame.Surface:
-    img = Image.open(path).convert("RGB")
-    target_w, target_h = tile_size
-    # Stretch to fill exactly tile rect (no bars, no crops)
-    stretched = img.resize((target_w, target_h), Image.LANCZOS)
-    mode = stretched.mode
-    data = stretched.tobytes()
-    surface = pygame.image.fromstring(data, stretched.size, mode)
-    return surface
+    return scale_to_tile(pygame.image.load(path), tile_size)
 
 
 class AssetManager:
-    def __init__(self, assets_root: str, supported_formats: List[str], tile_size: Tuple[int, int]):
+    def __init__(self, assets_root: str, supported_formats: Sequence[str], tile_size: Tuple[int, int]):
         self.assets_root = assets_root
         self.supported_formats = [ext.lower() for ext in supported_formats]
         self.tile_size = tile_size
         self.type_to_surfaces: Dict[str, List[pygame.Surface]] = {}
-
-    def preload(self, types: List[str]) -> None:
+        # Dense list of every loaded surface; tiles refer to images by index into it.
+        # Each type's surfaces occupy a contiguous range.
+        self.surfaces: List[pygame.Surface] = []
+        self._type_ranges: Dict[str, range] = {}
+        # Small int id per loaded type so hot-path comparisons avoid string equality
+        self.type_ids: Dict[str, int] = {}
+        # Dedicated RNG: avoids the shared module-level instance on the spawn path
+        self._rng = random.Random()
+
+    def preload(self, types: Sequence[str]) -> None:
+        # Surfaces are converted to the display pixel format at load time (alpha is dropped,
+        # tiles are opaque), so the display mode must already be set.
+        if pygame.display.get_surface() is None:
+            raise RuntimeError("AssetManager.preload requires pygame.display.set_mode() to be called first")
+        type_paths: List[Tuple[str, List[str]]] = []
         for type_name in types:
             tdir = os.path.join(self.assets_root, type_name)
             paths = list_images_for_type(tdir, self.supported_formats)
             if not paths:
                 raise FileNotFoundError(f"No images found for type '{type_name}' in {tdir}")
-            surfaces = [load_and_scale_image(p, self.tile_size) for p in paths]
-            self.type_to_surfaces[type_name] = surfaces
+            type_paths.append((type_name, paths))
+        # Decoding releases the GIL, so fan it out. Workers only call pygame.image.load,
+        # which decodes into a standalone software surface (no display or video
+        # subsystem involved); everything that touches the display (convert) and
+        # scaling stays on the calling thread. At most 2 * max_workers decodes are in
+        # flight or waiting at a time, so the number of full-size surfaces held at once
+        # is bounded no matter how far decoding runs ahead of scaling.
+        max_workers = min(8, os.cpu_count() or 1)
+        path_iter = iter([p for _, paths in type_paths for p in paths])
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            in_flight: Deque[Future[pygame.Surface]] = deque(
+                pool.submit(pygame.image.load, p) for p in islice(path_iter, 2 * max_workers)
+            )
+
+            def next_decoded() -> pygame.Surface:
+                # Consume in submission order and top the window back up
+                fut = in_flight.popleft()
+                nxt = next(path_iter, None)
+                if nxt is not None:
+                    in_flight.append(pool.submit(pygame.image.load, nxt))
+                return fut.result()
+
+            for type_name, paths in type_paths:
+                surfaces = [scale_to_tile(next_decoded(), self.tile_size) for _ in paths]
+                self.type_to_surfaces[type_name] = surfaces
+                start = len(self.surfaces)
+                self.surfaces.extend(surfaces)
+                self._type_ranges[type_name] = range(start, len(self.surfaces))
+                self.type_ids.setdefault(type_name, len(self.type_ids))
 
     def get_random_image(self, type_name: str) -> pygame.Surface:
-        surfaces = self.type_to_surfaces.get(type_name)
-        if not surfaces:
-            raise KeyError(f"Type '{type_name}' not loaded")
-        return random.choice(surfaces)
+        # preload guarantees every loaded type has at least one surface
+        try:
+            surfaces = self.type_to_surfaces[type_name]
+        except KeyError:
+            raise KeyError(f"Type '{type_name}' not loaded") from None
+        return surfaces[self._rng.randrange(len(surfaces))]
+
+    def get_random_image_index(self, type_name: str) -> int:
+        try:
+            r = self._type_ranges[type_name]
+        except KeyError:
+            raise KeyError(f"Type '{type_name}' not loaded") from None
+        return r.start + self._rng.randrange(len(r))
 
     def get_thumbnail(self, type_name: str, thumb_size: Tuple[int, int]) -> pygame.Surface:
         base = self.get_random_image(type_name)
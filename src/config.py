@@ -1,54 +1,75 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 from dataclasses import dataclass
-from typing import List
+from pathlib import Path
+from typing import Tuple
 
+try:
+    import orjson
 
-@dataclass
+    _loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json is fine for a small config
+    _loads = json.loads
+
+
+_ALLOWED_MODES = frozenset({"endless", "classic"})
+_ALLOWED_EXTS = frozenset({"png", "jpg"})
+
+
+@dataclass(frozen=True)
 class SpeedConfig:
     start_px_per_sec: float
     accel_px_per_min: float
     max_px_per_sec: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class HitWindowConfig:
     good: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class ControlsConfig:
-    keys: List[str]
+    keys: Tuple[str, ...]
 
-@dataclass
+@dataclass(frozen=True)
 class ClassicConfig:
     rows_total: int
     advance_animation_ms: int = 160
 
 
-@dataclass
+@dataclass(frozen=True)
 class GameConfig:
     lanes: int
     mode: str
     target_type: str
-    other_types: List[str]
+    other_types: Tuple[str, ...]
     speed: SpeedConfig
     hit_window_ms: HitWindowConfig
     assets_root: str
-    supported_formats: List[str]
+    supported_formats: Tuple[str, ...]
     controls: ControlsConfig
     classic: ClassicConfig | None
 
 
 def load_config(path: str) -> GameConfig:
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    # Parsed configs are memoized per file version; dataclasses are frozen so the
+    # shared instance can't be mutated by callers.
+    st = os.stat(path)
+    return _load_config_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> GameConfig:
+    raw = _loads(Path(path).read_bytes())
     speed = SpeedConfig(**raw["speed"])
     # Ignore unknown fields in hit_window_ms (e.g., 'perfect' if present)
     hit_win_raw = raw["hit_window_ms"]
     hit = HitWindowConfig(good=int(hit_win_raw["good"]))
-    controls = ControlsConfig(keys=list(raw["controls"]["keys"]))
+    controls = ControlsConfig(keys=tuple(raw["controls"]["keys"]))
     mode = str(raw["mode"]).lower()
     classic: ClassicConfig | None = None
     if mode == "classic":
@@ -61,11 +82,11 @@ def load_config(path: str) -> GameConfig:
         lanes=int(raw["lanes"]),
         mode=str(raw["mode"]),
         target_type=str(raw["target_type"]),
-        other_types=list(raw["other_types"]),
+        other_types=tuple(raw["other_types"]),
         speed=speed,
         hit_window_ms=hit,
         assets_root=str(raw["assets_root"]),
-        supported_formats=[s.lower() for s in raw["supported_formats"]],
+        supported_formats=tuple(s.lower() for s in raw["supported_formats"]),
         controls=controls,
         classic=classic,
     )
@@ -73,23 +94,27 @@ def load_config(path: str) -> GameConfig:
 
 
 def validate_config(cfg: GameConfig) -> None:
-    if cfg.mode not in {"endless", "classic"}:
+    if cfg.mode not in _ALLOWED_MODES:
         raise ValueError("mode must be one of {'endless','classic'}")
     if cfg.lanes != 4:
         raise ValueError("lanes must be exactly 4 per current spec")
     if not cfg.target_type:
         raise ValueError("target_type must be provided")
-    allowed_exts = {"png", "jpg"}
-    if not set(cfg.supported_formats).issubset(allowed_exts):
+    if not _ALLOWED_EXTS.issuperset(cfg.supported_formats):
         raise ValueError("supported_formats must be subset of {'png','jpg'}")
     if len(cfg.controls.keys) != cfg.lanes:
         raise ValueError("controls.keys length must equal lanes")
-    if len(set(k.lower() for k in cfg.controls.keys)) != len(cfg.controls.keys):
-        raise ValueError("controls.keys must be unique (case-insensitive)")
+    seen: set[str] = set()
+    for k in cfg.controls.keys:
+        kl = k.lower()
+        if kl in seen:
+            raise ValueError("controls.keys must be unique (case-insensitive)")
+        seen.add(kl)
     if cfg.mode == "endless":
-        if cfg.speed.start_px_per_sec <= 0 or cfg.speed.accel_px_per_min < 0 or cfg.speed.max_px_per_sec <= 0:
+        s = cfg.speed
+        if s.start_px_per_sec <= 0 or s.accel_px_per_min < 0 or s.max_px_per_sec <= 0:
             raise ValueError("speed values must be positive and accel non-negative")
-        if cfg.speed.max_px_per_sec < cfg.speed.start_px_per_sec:
+        if s.max_px_per_sec < s.start_px_per_sec:
             raise ValueError("max_px_per_sec must be >= start_px_per_sec")
     if cfg.mode == "classic":
         if cfg.classic is None:
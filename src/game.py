@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import logging
+from collections import deque
+from itertools import chain
+from typing import Deque, Dict, Iterable, List, Optional
 
 import pygame
 import random
 
 from .constants import BASE_WIDTH, BASE_HEIGHT, HIT_LINE_FRACTION, ROWS_VISIBLE, MISS_TOLERANCE_PX, COLOR_BG, COLOR_LANE_GUIDE, COLOR_HIT_LINE
 from .config import GameConfig
-from .models import Tile
+from .models import Tile, TileState
 from .assets import AssetManager
-from .generator import generate_row
+from .generator import RowSpawner, generate_row
+
+
+logger = logging.getLogger(__name__)
 
 
 def calculate_lane_rects(window_width: int, window_height: int, lanes: int) -> List[pygame.Rect]:
@@ -30,24 +36,69 @@ def get_tile_size(window_width: int, window_height: int, rows_visible: int = ROW
     return lane_width, tile_height
 
 
-def draw_tiles(screen: pygame.Surface, tiles: List[Tile]) -> None:
-    for t in tiles:
-        if t.state == "active":
-            screen.blit(pygame.transform.smoothscale(t.image, (t.width, t.height)), (t.x, int(t.y)))
+def build_background(window_width: int, window_height: int, lane_rects: List[pygame.Rect]) -> pygame.Surface:
+    # Static chrome (fill + lane guides) baked once; blitted as a single copy per frame
+    bg = pygame.Surface((window_width, window_height)).convert()
+    bg.fill(COLOR_BG)
+    for i, rect in enumerate(lane_rects):
+        if i > 0:
+            pygame.draw.line(bg, COLOR_LANE_GUIDE, (rect.x, 0), (rect.x, window_height), 1)
+    return bg
+
+
+def build_hit_line(window_width: int) -> pygame.Surface:
+    line = pygame.Surface((window_width, 2)).convert()
+    line.fill(COLOR_HIT_LINE)
+    return line
+
+
+def draw_tiles(
+    screen: pygame.Surface, tiles: Iterable[Tile], surfaces: List[pygame.Surface], offset_y: float = 0.0
+) -> List[pygame.Rect]:
+    # Images are pre-scaled to tile size at preload; submit all blits in one call.
+    # Returns the non-empty screen areas drawn (tiles fully off screen clip to nothing),
+    # for dirty-rect display updates.
+    active = int(TileState.ACTIVE)  # plain int: skips the enum attribute lookup per tile
+    rects = screen.blits(
+        [(surfaces[t.image_idx], (t.x, int(t.y + offset_y))) for t in tiles if t.state == active]
+    )
+    return [r for r in rects if r.width and r.height]
 
 
 class Game:
-    def __init__(self, screen: pygame.Surface, cfg: GameConfig):
+    def __init__(self, screen: pygame.Surface, cfg: GameConfig, asset_manager: AssetManager):
         self.screen = screen
         self.cfg = cfg
+        self.asset_manager = asset_manager
+        self.target_type_id = asset_manager.type_ids[cfg.target_type]
         self.window_width, self.window_height = screen.get_size()
         self.lane_rects = calculate_lane_rects(self.window_width, self.window_height, cfg.lanes)
         self.hit_line_y = get_hit_line_y(self.window_height)
         self.tile_width, self.tile_height = get_tile_size(self.window_width, self.window_height)
+        self._bg = build_background(self.window_width, self.window_height, self.lane_rects)
+        self._hit_line = build_hit_line(self.window_width)
+        # All tiles share tile_height, so the hit span test reduces to a range on tile.y
+        self._half_tile_h = self.tile_height * 0.5
+        self._min_y_hit = self.hit_line_y - self.tile_height
+        self._max_y_hit = self.hit_line_y
+        self._early_hit_dist = self.tile_height / 4
         self.score = 0
         self.elapsed_time = 0.0
         self.current_speed = cfg.speed.start_px_per_sec
-        self.tiles: List[Tile] = []
+        # Active tiles per lane, ordered bottom→top (spawn order); hit tiles are removed
+        self.lanes_tiles: List[Deque[Tile]] = [deque() for _ in range(cfg.lanes)]
+        # Unhit target tiles in spawn order; the head is the only one that can newly miss
+        self.pending_targets: Deque[Tile] = deque()
+        # Tiles that left play (hit or scrolled off), recycled by generate_row
+        self.tile_pool: List[Tile] = []
+        self.spawner = RowSpawner(self.tile_height)
+        # Sub-pixel scroll carried between frames; tiles only move by whole pixels
+        self._y_subpx: float = 0.0
+        # Screen areas changed by the last render: per lane, the union of where its
+        # tiles were last frame and are now. Empty when nothing moved, spawned or was hit.
+        self.dirty_rects: List[pygame.Rect] = []
+        self._prev_lane_rects: Dict[int, pygame.Rect] = {}
+        self._drawn_key: Optional[tuple] = None
         self.running = True
         self.game_over = False
         self.last_fail_reason: Optional[str] = None
@@ -62,68 +113,117 @@ class Game:
             return
         self.elapsed_time += dt
         self.update_speed(dt)
-        for t in self.tiles:
-            if t.state == "active":
-                t.y += self.current_speed * dt
+        self._y_subpx += self.current_speed * dt
+        step = int(self._y_subpx)
+        if not step:
+            return
+        self._y_subpx -= step
+        bottom = self.window_height
+        self.spawner.advance(step)
+        for lane in self.lanes_tiles:
+            for t in lane:
+                t.y += step
+        # Check misses before pruning: a missed target must not reach the pool while it
+        # is still referenced from pending_targets
         self.check_misses()
+        if self.game_over:
+            return
+        # Drop tiles that scrolled off the bottom so the lanes stay bounded. With no miss,
+        # every pending target is still above the hit line, so only non-targets are pooled.
+        for lane in self.lanes_tiles:
+            while lane and lane[0].y >= bottom:
+                self.tile_pool.append(lane.popleft())
+
+    def add_tiles(self, tiles: Iterable[Tile]) -> None:
+        # Rows are spawned above existing ones, so appending keeps each lane ordered
+        for t in tiles:
+            self.lanes_tiles[t.lane_index].append(t)
+            if t.type_id == self.target_type_id:
+                self.pending_targets.append(t)
 
     def handle_keydown(self, lane_index: int) -> None:
-        print(f"DEBUG: handle_keydown lane={lane_index}")
+        logger.debug("handle_keydown lane=%d", lane_index)
         tile = self.find_tile_at_hit_line(lane_index)
         if tile is None:
             # No tile at the hit line in this lane: ignore tap (not a failure per spec)
-            print("DEBUG: no tile intersecting hit line; ignoring tap")
+            logger.debug("no tile intersecting hit line; ignoring tap")
             return
-        print(
-            f"DEBUG: hit candidate type={tile.type_name} y={tile.y:.1f} h={tile.height} hit_line={self.hit_line_y}"
+        logger.debug(
+            "hit candidate type=%s y=%d h=%d hit_line=%d", tile.type_name, tile.y, tile.height, self.hit_line_y
         )
-        if tile.type_name == self.cfg.target_type:
-            tile.state = "hit"
+        if tile.type_id == self.target_type_id:
+            tile.state = TileState.HIT
+            self.lanes_tiles[lane_index].remove(tile)
+            self.pending_targets.remove(tile)
+            self.tile_pool.append(tile)
             self.score += 1
-            print(f"DEBUG: HIT! score={self.score}")
+            logger.debug("HIT! score=%d", self.score)
         else:
             self.last_fail_reason = "wrong_tap"
             self.last_missed_type = tile.type_name
             self.game_over = True
-            print("DEBUG: WRONG TAP → game over")
+            logger.debug("WRONG TAP → game over")
 
     def find_tile_at_hit_line(self, lane_index: int) -> Optional[Tile]:
-        # Valid if the hit line intersects the tile's vertical span [y, y+height]
-        candidates: list[Tile] = []
-        for t in self.tiles:
-            if t.state != "active" or t.lane_index != lane_index:
-                continue
-            if t.y <= self.hit_line_y <= (t.y + t.height):
-                candidates.append(t)
-        if not candidates:
-            return None
-        # Choose the one whose center is closest to the hit line
-        candidates.sort(key=lambda t: abs((t.y + t.height / 2) - self.hit_line_y))
-        return candidates[0]
+        # Valid if the hit line intersects the tile's vertical span [y, y+height];
+        # choose the one whose center is closest to the hit line
+        center_offset = self._half_tile_h - self.hit_line_y
+        min_y, max_y = self._min_y_hit, self._max_y_hit
+        best: Optional[Tile] = None
+        best_dist = 0.0
+        for t in self.lanes_tiles[lane_index]:
+            if min_y <= t.y <= max_y:
+                dist = abs(t.y + center_offset)
+                if best is None or dist < best_dist:
+                    best, best_dist = t, dist
+                    # Rows are at least one tile apart, so no other tile in the lane can be closer
+                    if dist < self._early_hit_dist:
+                        break
+        return best
 
     def check_misses(self) -> None:
-        for t in self.tiles:
-            if t.state == "active" and t.type_name == self.cfg.target_type:
-                # Miss only after the tile's TOP passes below the hit line (tile entirely below the line)
-                if t.y > self.hit_line_y + MISS_TOLERANCE_PX:
-                    self.last_fail_reason = "missed_target"
-                    self.last_missed_type = self.cfg.target_type
-                    self.game_over = True
-                    print(
-                        f"DEBUG: MISS target type at y={t.y:.1f} passed line={self.hit_line_y} tol={MISS_TOLERANCE_PX}"
-                    )
-                    return
+        # All tiles move together, so the oldest pending target is always the lowest one
+        if not self.pending_targets:
+            return
+        t = self.pending_targets[0]
+        # Miss only after the tile's TOP passes below the hit line (tile entirely below the line)
+        if t.y > self.hit_line_y + MISS_TOLERANCE_PX:
+            self.mark_missed(t)
+
+    def mark_missed(self, t: Tile) -> None:
+        self.last_fail_reason = "missed_target"
+        self.last_missed_type = self.cfg.target_type
+        self.game_over = True
+        logger.debug(
+            "MISS target type at y=%d passed line=%d tol=%d", t.y, self.hit_line_y, MISS_TOLERANCE_PX
+        )
 
     def render(self) -> None:
-        self.screen.fill(COLOR_BG)
-        # lane guides
-        for i, rect in enumerate(self.lane_rects):
-            if i > 0:
-                pygame.draw.line(self.screen, COLOR_LANE_GUIDE, (rect.x, 0), (rect.x, self.window_height), 1)
+        # background + lane guides
+        self.screen.blit(self._bg, (0, 0))
         # tiles
-        draw_tiles(self.screen, self.tiles)
+        tile_rects = draw_tiles(self.screen, chain.from_iterable(self.lanes_tiles), self.asset_manager.surfaces)
+        # Every tile in a lane shares the lane's x (clipping is only vertical), so the
+        # single blits result is grouped back into one union per lane by x
+        lane_rects: Dict[int, pygame.Rect] = {}
+        for r in tile_rects:
+            cur = lane_rects.get(r.x)
+            lane_rects[r.x] = r if cur is None else cur.union(r)
+        # Scrolling and spawning move spawner.top_y; hits change the score
+        drawn_key = (self.spawner.top_y, self.score)
+        if drawn_key == self._drawn_key:
+            self.dirty_rects = []
+        else:
+            self._drawn_key = drawn_key
+            prev_rects = self._prev_lane_rects
+            dirty: List[pygame.Rect] = []
+            for x in prev_rects.keys() | lane_rects.keys():
+                prev, cur = prev_rects.get(x), lane_rects.get(x)
+                dirty.append(cur if prev is None else prev if cur is None else prev.union(cur))
+            self.dirty_rects = dirty
+            self._prev_lane_rects = lane_rects
         # hit line on top
-        pygame.draw.line(self.screen, COLOR_HIT_LINE, (0, self.hit_line_y), (self.window_width, self.hit_line_y), 2)
+        self.screen.blit(self._hit_line, (0, self.hit_line_y))
 
 
 
@@ -132,10 +232,16 @@ class ClassicGame:
         self.screen = screen
         self.cfg = cfg
         self.asset_manager = asset_manager
+        self.target_type_id = asset_manager.type_ids[cfg.target_type]
         self.window_width, self.window_height = screen.get_size()
         self.lane_rects = calculate_lane_rects(self.window_width, self.window_height, cfg.lanes)
         self.hit_line_y = get_hit_line_y(self.window_height)
         self.tile_width, self.tile_height = get_tile_size(self.window_width, self.window_height)
+        self._bg = build_background(self.window_width, self.window_height, self.lane_rects)
+        self._hit_line = build_hit_line(self.window_width)
+        self._half_tile_h = self.tile_height * 0.5
+        self._min_y_hit = self.hit_line_y - self.tile_height
+        self._max_y_hit = self.hit_line_y
 
         # Timing
         self.elapsed_time: float = 0.0
@@ -153,31 +259,39 @@ class ClassicGame:
         self.advance_elapsed_ms: float = 0.0
         self.advancing: bool = False
         self.board_offset_y: float = 0.0
-
-        # Rows
-        self.rows: List[List[Tile]] = self._generate_all_rows()
+        # Accumulated shift from completed advances; tile y values are never rewritten
+        self.board_total_offset_y: float = 0.0
+        # Screen areas changed by the last render (tiles drawn now and when the board
+        # last changed); empty while the board is idle
+        self.dirty_rects: List[pygame.Rect] = []
+        self._prev_tile_rects: List[pygame.Rect] = []
+        self._drawn_key: Optional[tuple] = None
+
+        # Rows: only a visible window ahead of the current row is generated; the rest
+        # are produced one at a time as rows are cleared
+        self._rng = random.Random()
+        self._rows_generated: int = 0
+        self.rows: Deque[List[Tile]] = deque()
+        for _ in range(min(self.rows_total, ROWS_VISIBLE + 4)):
+            self._generate_one_row()
 
     def _base_row_y(self) -> int:
         return int(self.hit_line_y - self.tile_height // 2)
 
-    def _generate_all_rows(self) -> List[List[Tile]]:
-        rows: List[List[Tile]] = []
-        rng = random.Random()
-        base_y = self._base_row_y()
-        for i in range(self.rows_total):
-            y_top = base_y - i * self.tile_height
-            row_tiles = generate_row(
-                self.cfg.target_type,
-                self.cfg.other_types,
-                self.cfg.lanes,
-                self.lane_rects,
-                self.asset_manager,
-                self.tile_height,
-                rng,
-                y_top,
-            )
-            rows.append(row_tiles)
-        return rows
+    def _generate_one_row(self) -> None:
+        y_top = self._base_row_y() - self._rows_generated * self.tile_height
+        row_tiles = generate_row(
+            self.cfg.target_type,
+            self.cfg.other_types,
+            self.cfg.lanes,
+            self.lane_rects,
+            self.asset_manager,
+            self.tile_height,
+            self._rng,
+            y_top,
+        )
+        self.rows.append(row_tiles)
+        self._rows_generated += 1
 
     def update(self, dt: float) -> None:
         if self.game_over or self.finished:
@@ -202,8 +316,8 @@ class ClassicGame:
         tile = self._find_tile_at_hit_line_in_current_row(lane_index)
         if tile is None:
             return
-        if tile.type_name == self.cfg.target_type:
-            tile.state = "hit"
+        if tile.type_id == self.target_type_id:
+            tile.state = TileState.HIT
             self._start_advance()
         else:
             self.last_fail_reason = "wrong_tap"
@@ -213,17 +327,21 @@ class ClassicGame:
         if not self.rows:
             return None
         current_row = self.rows[0]
-        candidates: list[Tile] = []
+        offset_y = self.board_total_offset_y + self.board_offset_y
+        active = int(TileState.ACTIVE)
+        center_offset = offset_y + self._half_tile_h - self.hit_line_y
+        min_y = self._min_y_hit - offset_y
+        max_y = self._max_y_hit - offset_y
+        best: Optional[Tile] = None
+        best_dist = 0.0
         for t in current_row:
-            if t.state != "active" or t.lane_index != lane_index:
+            if t.state != active or t.lane_index != lane_index:
                 continue
-            y0 = t.y + self.board_offset_y
-            if y0 <= self.hit_line_y <= (y0 + t.height):
-                candidates.append(t)
-        if not candidates:
-            return None
-        candidates.sort(key=lambda t: abs((t.y + self.board_offset_y + t.height / 2) - self.hit_line_y))
-        return candidates[0]
+            if min_y <= t.y <= max_y:
+                dist = abs(t.y + center_offset)
+                if best is None or dist < best_dist:
+                    best, best_dist = t, dist
+        return best
 
     def _start_advance(self) -> None:
         self.advancing = True
@@ -231,36 +349,35 @@ class ClassicGame:
         self.board_offset_y = 0.0
 
     def _finalize_advance(self) -> None:
-        # Apply final offset permanently to remaining rows, then reset offset
-        if self.board_offset_y != 0.0:
-            for row in self.rows:
-                for t in row:
-                    t.y += self.board_offset_y
+        # Fold the completed one-row advance into the board offset (also covers instant advances)
+        self.board_total_offset_y += self.tile_height
         self.advancing = False
         self.advance_elapsed_ms = 0.0
         self.board_offset_y = 0.0
-        # Clear current row
+        # Clear current row and top up the generated window
         if self.rows:
-            self.rows.pop(0)
+            self.rows.popleft()
+        if self._rows_generated < self.rows_total:
+            self._generate_one_row()
         self.cleared_rows += 1
         if self.cleared_rows >= self.rows_total:
             self.finished = True
             self.timer_running = False
 
     def render(self) -> None:
-        self.screen.fill(COLOR_BG)
-        # lane guides
-        for i, rect in enumerate(self.lane_rects):
-            if i > 0:
-                pygame.draw.line(self.screen, COLOR_LANE_GUIDE, (rect.x, 0), (rect.x, self.window_height), 1)
+        # background + lane guides
+        self.screen.blit(self._bg, (0, 0))
         # draw tiles for all rows with current offset
-        for row in self.rows:
-            for t in row:
-                if t.state == "active":
-                    self.screen.blit(
-                        pygame.transform.smoothscale(t.image, (t.width, t.height)),
-                        (t.x, int(t.y + self.board_offset_y)),
-                    )
+        offset_y = self.board_total_offset_y + self.board_offset_y
+        tile_rects = draw_tiles(self.screen, chain.from_iterable(self.rows), self.asset_manager.surfaces, offset_y)
+        # The board only changes when it scrolls, a hit starts an advance, or a row is cleared
+        drawn_key = (int(offset_y), self.advancing, self.cleared_rows)
+        if drawn_key == self._drawn_key:
+            self.dirty_rects = []
+        else:
+            self._drawn_key = drawn_key
+            self.dirty_rects = self._prev_tile_rects + tile_rects
+            self._prev_tile_rects = tile_rects
         # hit line
-        pygame.draw.line(self.screen, COLOR_HIT_LINE, (0, self.hit_line_y), (self.window_width, self.hit_line_y), 2)
+        self.screen.blit(self._hit_line, (0, self.hit_line_y))
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import List
+from typing import List, Optional, Sequence
 
 import pygame
 
@@ -9,34 +9,79 @@ from .assets import AssetManager
 from .models import Tile
 
 
+class RowSpawner:
+    # Endless-mode spawn cadence: a new row is due once the last one has fully entered the screen
+    __slots__ = ("spacing", "top_y")
+
+    def __init__(self, spacing: int):
+        self.spacing = spacing
+        # y of the most recently spawned row; None until the first spawn
+        self.top_y: Optional[int] = None
+
+    def advance(self, dy: int) -> None:
+        if self.top_y is not None:
+            self.top_y += dy
+
+    def due(self) -> bool:
+        return self.top_y is None or self.top_y >= 0
+
+    def push_row(self) -> int:
+        # Stack exactly one row above the previous so rows never overlap or leave gaps
+        self.top_y = -self.spacing if self.top_y is None else self.top_y - self.spacing
+        return self.top_y
+
+
 def choose_target_lane(rng: random.Random, lanes: int) -> int:
     return rng.randrange(lanes)
 
 
+def make_tile(
+    pool: Optional[List[Tile]],
+    lane_index: int,
+    type_name: str,
+    type_id: int,
+    image_idx: int,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+) -> Tile:
+    if pool:
+        tile = pool.pop()
+        tile.reinit(lane_index, type_name, type_id, image_idx, x, y, width, height)
+        return tile
+    return Tile(lane_index=lane_index, type_name=type_name, type_id=type_id, image_idx=image_idx, x=x, y=y, width=width, height=height)
+
+
 def generate_row(
     target_type: str,
-    other_types: List[str],
+    other_types: Sequence[str],
     lanes: int,
     lane_rects: List[pygame.Rect],
     asset_manager: AssetManager,
     tile_height: int,
     rng: random.Random,
     y_top: int,
+    pool: Optional[List[Tile]] = None,
 ) -> List[Tile]:
     tiles: List[Tile] = []
     target_lane = choose_target_lane(rng, lanes)
+    # Draw all non-target types for the row in one call
+    others = iter(rng.choices(other_types, k=lanes - 1)) if other_types else None
     for lane_idx in range(lanes):
         lane_rect = lane_rects[lane_idx]
         x = lane_rect.x
         width = lane_rect.width
         if lane_idx == target_lane:
-            img = asset_manager.get_random_image(target_type)
-            tiles.append(Tile(lane_index=lane_idx, type_name=target_type, image=img, x=x, y=y_top, width=width, height=tile_height))
+            image_idx = asset_manager.get_random_image_index(target_type)
+            type_id = asset_manager.type_ids[target_type]
+            tiles.append(make_tile(pool, lane_idx, target_type, type_id, image_idx, x, y_top, width, tile_height))
         else:
-            if other_types:
-                t = rng.choice(other_types)
-                img = asset_manager.get_random_image(t)
-                tiles.append(Tile(lane_index=lane_idx, type_name=t, image=img, x=x, y=y_top, width=width, height=tile_height))
+            if others is not None:
+                t = next(others)
+                image_idx = asset_manager.get_random_image_index(t)
+                type_id = asset_manager.type_ids[t]
+                tiles.append(make_tile(pool, lane_idx, t, type_id, image_idx, x, y_top, width, tile_height))
             else:
                 # No other types: leave lane empty for this row
                 pass
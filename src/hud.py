@@ -1,55 +1,112 @@
 from __future__ import annotations
 
+from typing import Dict, List, Tuple
+
 import pygame
 from .constants import COLOR_HUD_TEXT, COLOR_TIMER
 
 
-def render_hud(
-    screen: pygame.Surface,
-    font: pygame.font.Font,
-    target_thumb: pygame.Surface,
-    score: int,
-    elapsed_time: float,
-    timer_full_scale_sec: float,
-    window_width: int,
-) -> None:
-    # Target thumbnail
-    screen.blit(target_thumb, (8, 8))
-    # Score text
-    score_surf = font.render(f"Score: {score}", True, COLOR_HUD_TEXT)
-    screen.blit(score_surf, (8 + target_thumb.get_width() + 10, 12))
-    # Timer bar (purely visual)
-    fill_frac = min(1.0, elapsed_time / max(0.001, timer_full_scale_sec))
-    bar_w = int(window_width * 0.4)
-    bar_h = 8
-    x = window_width - bar_w - 12
-    y = 16
-    pygame.draw.rect(screen, (60, 60, 60), pygame.Rect(x, y, bar_w, bar_h), 1)
-    pygame.draw.rect(screen, COLOR_TIMER, pygame.Rect(x + 1, y + 1, int((bar_w - 2) * fill_frac), bar_h - 2))
-
-
-
-def render_hud_classic(
-    screen: pygame.Surface,
-    font: pygame.font.Font,
-    target_thumb: pygame.Surface,
-    cleared_rows: int,
-    rows_total: int,
-    elapsed_time: float,
-    window_width: int,
-) -> None:
-    # Target thumbnail
-    screen.blit(target_thumb, (8, 8))
-    # Rows progress
-    rows_text = f"Rows: {cleared_rows}/{rows_total}"
-    rows_surf = font.render(rows_text, True, COLOR_HUD_TEXT)
-    screen.blit(rows_surf, (8 + target_thumb.get_width() + 10, 12))
-    # Timer (mm:ss.ms)
-    total_ms = int(elapsed_time * 1000)
-    minutes = total_ms // 60000
-    seconds = (total_ms % 60000) // 1000
-    centis = (total_ms % 1000) // 10
-    time_text = f"{minutes:02d}:{seconds:02d}.{centis:02d}"
-    time_surf = font.render(time_text, True, COLOR_TIMER)
-    screen.blit(time_surf, (window_width - time_surf.get_width() - 12, 12))
+_TEXT_CACHE_MAX = 128
+_text_cache: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+
+def _render_cached(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    # HUD strings repeat across many frames; only rasterize each (font, text, color) once
+    key = (id(font), text, color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        # Cached surfaces are blitted every frame, so match the display format once
+        surf = font.render(text, True, color).convert_alpha()
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _text_cache[next(iter(_text_cache))]
+        _text_cache[key] = surf
+    return surf
+
+
+class HUD:
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        target_thumb: pygame.Surface,
+        window_width: int,
+        timer_full_scale_sec: float = 60.0,
+    ):
+        self.font = font
+        self.target_thumb = target_thumb
+        self.window_width = window_width
+        self.timer_full_scale_sec = timer_full_scale_sec
+        self._text_x = 8 + target_thumb.get_width() + 10
+        # Static label prefix; only the number is rendered per value
+        self._score_label = _render_cached(font, "Score: ", COLOR_HUD_TEXT)
+        # Timer bar geometry is fixed per window width; only the fill width changes
+        bar_w = int(window_width * 0.4)
+        bar_h = 8
+        x = window_width - bar_w - 12
+        y = 16
+        self._bar_inner_w = bar_w - 2
+        self._outer_rect = pygame.Rect(x, y, bar_w, bar_h)
+        self._inner_rect = pygame.Rect(x + 1, y + 1, 0, bar_h - 2)
+        # HUD contents are composed into a transparent band and only redrawn when the
+        # displayed values change; `changed` reports whether the last render redrew it.
+        # The classic timer changes every frame, so it is drawn straight to the screen
+        # on top of the band instead of being part of it.
+        band_h = max(8 + target_thumb.get_height(), 12 + font.get_linesize(), y + bar_h) + 4
+        self.rect = pygame.Rect(0, 0, window_width, band_h)
+        self._snapshot = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self._snapshot_key: tuple | None = None
+        self.changed = True
+        self._timer_rect: pygame.Rect | None = None
+        # Screen areas the last render changed, for dirty-rect display updates
+        self.dirty_rects: List[pygame.Rect] = []
+
+    def render(self, screen: pygame.Surface, score: int, elapsed_time: float) -> None:
+        # Timer bar (purely visual); quantized to whole pixels of fill
+        fill_frac = min(1.0, elapsed_time / max(0.001, self.timer_full_scale_sec))
+        fill_w = int(self._bar_inner_w * fill_frac)
+        key = (score, fill_w)
+        self.changed = key != self._snapshot_key
+        if self.changed:
+            self._snapshot_key = key
+            snap = self._snapshot
+            snap.fill((0, 0, 0, 0))
+            # Target thumbnail
+            snap.blit(self.target_thumb, (8, 8))
+            # Score text
+            snap.blit(self._score_label, (self._text_x, 12))
+            score_surf = _render_cached(self.font, str(score), COLOR_HUD_TEXT)
+            snap.blit(score_surf, (self._text_x + self._score_label.get_width(), 12))
+            self._inner_rect.width = fill_w
+            pygame.draw.rect(snap, (60, 60, 60), self._outer_rect, 1)
+            pygame.draw.rect(snap, COLOR_TIMER, self._inner_rect)
+        screen.blit(self._snapshot, (0, 0))
+        self.dirty_rects = [self.rect] if self.changed else []
 
+    def render_classic(self, screen: pygame.Surface, cleared_rows: int, rows_total: int, elapsed_time: float) -> None:
+        rows_text = f"Rows: {cleared_rows}/{rows_total}"
+        # Timer (mm:ss.ms)
+        total_ms = int(elapsed_time * 1000)
+        minutes = total_ms // 60000
+        seconds = (total_ms % 60000) // 1000
+        centis = (total_ms % 1000) // 10
+        time_text = f"{minutes:02d}:{seconds:02d}.{centis:02d}"
+        self.changed = rows_text != self._snapshot_key
+        if self.changed:
+            self._snapshot_key = rows_text
+            snap = self._snapshot
+            snap.fill((0, 0, 0, 0))
+            # Target thumbnail
+            snap.blit(self.target_thumb, (8, 8))
+            # Rows progress
+            snap.blit(_render_cached(self.font, rows_text, COLOR_HUD_TEXT), (self._text_x, 12))
+        screen.blit(self._snapshot, (0, 0))
+        # The timer string changes nearly every frame, so caching it would only churn
+        time_surf = self.font.render(time_text, True, COLOR_TIMER)
+        timer_rect = screen.blit(time_surf, (self.window_width - time_surf.get_width() - 12, 12))
+        if self.changed:
+            self.dirty_rects = [self.rect]
+        else:
+            # Cover the previous timer too: a narrower string leaves stale pixels to clear
+            prev = self._timer_rect
+            self.dirty_rects = [timer_rect if prev is None else timer_rect.union(prev)]
+        self._timer_rect = timer_rect
@@ -1,17 +1,35 @@
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import sys
 import time
 import random
 import pygame
 
-from .config import load_config, validate_config
+from .config import GameConfig, load_config, validate_config
 from .constants import BASE_WIDTH, BASE_HEIGHT, ROWS_VISIBLE
 from .assets import AssetManager, validate_expected_type_dirs
 from .game import Game, ClassicGame, calculate_lane_rects, get_hit_line_y, get_tile_size
 from .generator import generate_row
-from .hud import render_hud, render_hud_classic
+from .hud import HUD
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def key_name_table() -> dict[str, int]:
+    # Lower-cased pygame key name -> key code, built once from the K_* constants.
+    # (Scanning a fixed code range would miss SDL2's large codes for arrows/F-keys.)
+    table: dict[str, int] = {}
+    for attr, code in vars(pygame).items():
+        if attr.startswith("K_") and isinstance(code, int):
+            name = pygame.key.name(code).lower()
+            if name:
+                table.setdefault(name, code)
+    return table
 
 
 def normalize_keys_to_pygame(keys):
@@ -21,10 +39,13 @@ def normalize_keys_to_pygame(keys):
     for raw in keys:
         if isinstance(raw, str):
             name = raw.strip().lower()
-            try:
-                code = pygame.key.key_code(name)
-            except Exception as exc:
-                raise ValueError(f"Invalid key name in controls.keys: {raw}") from exc
+            code = key_name_table().get(name)
+            if code is None:
+                # Not a canonical name; let pygame resolve aliases before rejecting
+                try:
+                    code = pygame.key.key_code(name)
+                except Exception as exc:
+                    raise ValueError(f"Invalid key name in controls.keys: {raw}") from exc
             result.append(code)
         else:
             raise ValueError("controls.keys items must be strings representing pygame key names")
@@ -34,13 +55,6 @@ def normalize_keys_to_pygame(keys):
     return result
 
 
-def key_to_lane(key: int, keys: list[int]) -> int | None:
-    for idx, k in enumerate(keys):
-        if key == k:
-            return idx
-    return None
-
-
 def init_pygame_window(width: int, height: int, caption: str) -> pygame.Surface:
     pygame.init()
     screen = pygame.display.set_mode((width, height))
@@ -48,132 +62,170 @@ def init_pygame_window(width: int, height: int, caption: str) -> pygame.Surface:
     return screen
 
 
+def new_game(
+    cfg: GameConfig,
+    screen: pygame.Surface,
+    asset_manager: AssetManager,
+    lane_rects: list[pygame.Rect],
+    tile_h: int,
+    rng: random.Random,
+) -> Game | ClassicGame:
+    if cfg.mode != "endless":
+        return ClassicGame(screen, cfg, asset_manager)
+    game = Game(screen, cfg, asset_manager)
+    # Seed initial rows
+    for _ in range(ROWS_VISIBLE + 1):
+        row_y = game.spawner.push_row()
+        game.add_tiles(
+            generate_row(cfg.target_type, cfg.other_types, cfg.lanes, lane_rects, asset_manager, tile_h, rng, row_y, game.tile_pool)
+        )
+    return game
+
+
 def run() -> None:
     cfg = load_config(os.path.join(os.path.dirname(__file__), "..", "config.json"))
     validate_config(cfg)
 
+    # Bound once: the spawn call below runs every frame in endless mode
+    target_type = cfg.target_type
+    other_types = cfg.other_types
+    lanes = cfg.lanes
+    endless = cfg.mode == "endless"
+    all_types = [target_type, *other_types]
+
     # Validate assets exist for configured types
-    validate_expected_type_dirs(cfg.assets_root, {cfg.target_type, *cfg.other_types})
+    validate_expected_type_dirs(cfg.assets_root, set(all_types))
 
     screen = init_pygame_window(BASE_WIDTH, BASE_HEIGHT, "Piano Tiles (Images)")
     clock = pygame.time.Clock()
 
-    lane_rects = calculate_lane_rects(BASE_WIDTH, BASE_HEIGHT, cfg.lanes)
+    lane_rects = calculate_lane_rects(BASE_WIDTH, BASE_HEIGHT, lanes)
     tile_w, tile_h = get_tile_size(BASE_WIDTH, BASE_HEIGHT, ROWS_VISIBLE)
 
     asset_manager = AssetManager(cfg.assets_root, cfg.supported_formats, (tile_w, tile_h))
     # Preload only configured types
-    asset_manager.preload([cfg.target_type, *cfg.other_types])
+    asset_manager.preload(all_types)
 
     rng = random.Random()
-    if cfg.mode == "endless":
-        game = Game(screen, cfg)
-        # Seed initial rows
-        start_y = -tile_h
-        spacing = tile_h
-        for i in range(ROWS_VISIBLE + 1):
-            row_y = start_y - i * spacing
-            game.tiles.extend(
-                generate_row(cfg.target_type, cfg.other_types, cfg.lanes, lane_rects, asset_manager, tile_h, rng, row_y)
-            )
-    else:
-        game = ClassicGame(screen, cfg, asset_manager)
+    game = new_game(cfg, screen, asset_manager, lane_rects, tile_h, rng)
 
     font = pygame.font.SysFont(None, 24)
-    target_thumb = asset_manager.get_thumbnail(cfg.target_type, (40, 40))
+    target_thumb = asset_manager.get_thumbnail(target_type, (40, 40))
     timer_full_scale_sec = 60.0
+    hud = HUD(font, target_thumb, BASE_WIDTH, timer_full_scale_sec)
+
+    # Game-over/finished overlay: static pieces are built once; text is re-rendered
+    # only when its content changes
+    go_font = pygame.font.SysFont(None, 48)
+    # Solid surface with surface-level alpha: a uniform blend instead of per-pixel alpha
+    overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT)).convert()
+    overlay.fill((0, 0, 0))
+    overlay.set_alpha(160)
+    hint = font.render("Press R to restart, ESC/Q to quit", True, (200, 200, 200))
+    go_text_key: tuple[str, str, str] | None = None
+    go_texts: tuple[pygame.Surface, pygame.Surface, pygame.Surface | None] | None = None
 
     keys_norm = normalize_keys_to_pygame(cfg.controls.keys)
+    keys_map = {k: i for i, k in enumerate(keys_norm)}
+
+    full_redraw = True
+    # Above this much dirty area a partial update costs more than a full flip
+    screen_area = BASE_WIDTH * BASE_HEIGHT
+
+    # Only these events are queued; SDL drops the rest (mouse motion, etc.) before they
+    # become Python objects. VIDEOEXPOSE stays allowed so exposes still force a full redraw.
+    handled_events = [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE]
+    pygame.event.set_blocked(None)  # None blocks every type; then allow ours
+    pygame.event.set_allowed(handled_events)
 
     running = True
+    last_frame = time.perf_counter()
     while running:
-        dt = clock.tick(60) / 1000.0
+        # Pace with the busy-loop tick (sub-ms accurate); measure dt separately at full resolution
+        clock.tick_busy_loop(60)
+        now = time.perf_counter()
+        dt = now - last_frame
+        last_frame = now
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                full_redraw = True
             elif event.type == pygame.KEYDOWN:
-                print(f"DEBUG: keydown key={event.key}")
-                lane_idx = key_to_lane(event.key, keys_norm)
+                logger.debug("keydown key=%s", event.key)
+                lane_idx = keys_map.get(event.key)
                 if lane_idx is not None and not getattr(game, "game_over", False) and not getattr(game, "finished", False):
                     game.handle_keydown(lane_idx)
                 elif event.key == pygame.K_r and (getattr(game, "game_over", False) or getattr(game, "finished", False)):
-                    # Simple restart: re-run main
-                    run()
-                    return
+                    # Restart in place: keep the window, preloaded assets and fonts
+                    game = new_game(cfg, screen, asset_manager, lane_rects, tile_h, rng)
+                    full_redraw = True
                 elif event.key in (pygame.K_ESCAPE, pygame.K_q):
                     running = False
 
         if not game.game_over:
             game.update(dt)
-            if cfg.mode == "endless":
-                # Spawn new rows based on the topmost tile position
-                active_tiles = [t for t in game.tiles if t.state == "active"]
-                if active_tiles:
-                    top_y = min(t.y for t in active_tiles)
-                else:
-                    top_y = 1e9
-                if top_y >= 0:
-                    game.tiles.extend(
+            # update() may have just ended the game; don't spawn onto a finished board
+            if endless and not game.game_over:
+                if game.spawner.due():
+                    game.add_tiles(
                         generate_row(
-                            cfg.target_type,
-                            cfg.other_types,
-                            cfg.lanes,
+                            target_type,
+                            other_types,
+                            lanes,
                             lane_rects,
                             asset_manager,
                             tile_h,
                             rng,
-                            -tile_h,
+                            game.spawner.push_row(),
+                            game.tile_pool,
                         )
                     )
 
         game.render()
 
         # HUD
-        if cfg.mode == "endless":
-            render_hud(screen, font, target_thumb, game.score, game.elapsed_time, timer_full_scale_sec, BASE_WIDTH)
+        if endless:
+            hud.render(screen, game.score, game.elapsed_time)
         else:
             # Classic mode HUD
-            render_hud_classic(screen, font, target_thumb, getattr(game, "cleared_rows", 0), getattr(game, "rows_total", 0), getattr(game, "elapsed_time", 0.0), BASE_WIDTH)
+            hud.render_classic(screen, getattr(game, "cleared_rows", 0), getattr(game, "rows_total", 0), getattr(game, "elapsed_time", 0.0))
 
         # Overlays
-        if cfg.mode == "endless":
-            if game.game_over:
-                overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 160))
-                screen.blit(overlay, (0, 0))
-                go_font = pygame.font.SysFont(None, 48)
-                txt1 = go_font.render("Game Over", True, (255, 255, 255))
-                txt2 = font.render(f"Score: {game.score}", True, (255, 255, 255))
+        show_overlay = game.game_over or getattr(game, "finished", False)
+        if show_overlay:
+            if endless:
                 reason = game.last_fail_reason or ""
                 missed = f"Missed: {game.last_missed_type}" if game.last_missed_type else ""
-                txt3 = font.render((missed or reason), True, (255, 200, 200))
-                screen.blit(txt1, (BASE_WIDTH // 2 - txt1.get_width() // 2, BASE_HEIGHT // 2 - 60))
-                screen.blit(txt2, (BASE_WIDTH // 2 - txt2.get_width() // 2, BASE_HEIGHT // 2))
-                if txt3.get_width() > 0:
-                    screen.blit(txt3, (BASE_WIDTH // 2 - txt3.get_width() // 2, BASE_HEIGHT // 2 + 28))
-                hint = font.render("Press R to restart, ESC/Q to quit", True, (200, 200, 200))
-                screen.blit(hint, (BASE_WIDTH // 2 - hint.get_width() // 2, BASE_HEIGHT // 2 + 60))
-        else:
-            # Classic overlays: finished or game_over
-            if getattr(game, "finished", False) or getattr(game, "game_over", False):
-                overlay = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 160))
-                screen.blit(overlay, (0, 0))
+                go_key = ("Game Over", f"Score: {game.score}", missed or reason)
+            else:
+                # Classic overlays: finished or game_over
                 title = "Finished!" if getattr(game, "finished", False) else "Game Over"
-                go_font = pygame.font.SysFont(None, 48)
-                txt1 = go_font.render(title, True, (255, 255, 255))
                 time_text = f"Time: {int(game.elapsed_time // 60):02d}:{int(game.elapsed_time % 60):02d}.{int((game.elapsed_time*1000)%1000)//10:02d}"
-                txt2 = font.render(time_text, True, (255, 255, 255))
-                reason = getattr(game, "last_fail_reason", "") or ""
-                txt3 = font.render(reason, True, (255, 200, 200)) if reason else None
-                screen.blit(txt1, (BASE_WIDTH // 2 - txt1.get_width() // 2, BASE_HEIGHT // 2 - 60))
-                screen.blit(txt2, (BASE_WIDTH // 2 - txt2.get_width() // 2, BASE_HEIGHT // 2))
-                if txt3 and txt3.get_width() > 0:
-                    screen.blit(txt3, (BASE_WIDTH // 2 - txt3.get_width() // 2, BASE_HEIGHT // 2 + 28))
-                hint = font.render("Press R to restart, ESC/Q to quit", True, (200, 200, 200))
-                screen.blit(hint, (BASE_WIDTH // 2 - hint.get_width() // 2, BASE_HEIGHT // 2 + 60))
-
-        pygame.display.flip()
+                go_key = (title, time_text, getattr(game, "last_fail_reason", "") or "")
+            if go_key != go_text_key:
+                title, line2, line3 = go_key
+                go_texts = (
+                    go_font.render(title, True, (255, 255, 255)),
+                    font.render(line2, True, (255, 255, 255)),
+                    font.render(line3, True, (255, 200, 200)) if line3 else None,
+                )
+                go_text_key = go_key
+            txt1, txt2, txt3 = go_texts
+            screen.blit(overlay, (0, 0))
+            screen.blit(txt1, (BASE_WIDTH // 2 - txt1.get_width() // 2, BASE_HEIGHT // 2 - 60))
+            screen.blit(txt2, (BASE_WIDTH // 2 - txt2.get_width() // 2, BASE_HEIGHT // 2))
+            if txt3 is not None:
+                screen.blit(txt3, (BASE_WIDTH // 2 - txt3.get_width() // 2, BASE_HEIGHT // 2 + 28))
+            screen.blit(hint, (BASE_WIDTH // 2 - hint.get_width() // 2, BASE_HEIGHT // 2 + 60))
+
+        # Only tiles (old and new positions) and the HUD areas that changed
+        dirty = game.dirty_rects + hud.dirty_rects
+        if full_redraw or show_overlay or sum(r.width * r.height for r in dirty) >= screen_area:
+            pygame.display.flip()
+            full_redraw = False
+        elif dirty:
+            pygame.display.update(dirty)
 
 
 if __name__ == "__main__":
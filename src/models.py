@@ -1,25 +1,58 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal
+from dataclasses import dataclass, field
+from enum import IntEnum
 import pygame
 
 
-TileState = Literal["active", "hit", "missed"]
+class TileState(IntEnum):
+    ACTIVE = 0
+    HIT = 1
+    MISSED = 2
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Tile:
     lane_index: int
     type_name: str
-    image: pygame.Surface
+    type_id: int
+    image_idx: int  # index into AssetManager.surfaces
     x: int
-    y: float
+    y: int
     width: int
     height: int
-    state: TileState = "active"
+    state: TileState = TileState.ACTIVE
+    _rect: pygame.Rect = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def reinit(
+        self,
+        lane_index: int,
+        type_name: str,
+        type_id: int,
+        image_idx: int,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+    ) -> None:
+        # Recycle a pooled tile in place instead of allocating a new one
+        self.lane_index = lane_index
+        self.type_name = type_name
+        self.type_id = type_id
+        self.image_idx = image_idx
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.state = TileState.ACTIVE
+        self._rect.update(x, y, width, height)
 
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(self.x, int(self.y), self.width, self.height)
+        # Shared, mutated in place; callers that keep it across frames should .copy()
+        self._rect.y = self.y
+        return self._rect
 
 